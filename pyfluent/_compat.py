@@ -0,0 +1,7 @@
+"""Compatibility helpers for the Python versions supported by PyFluent."""
+
+import sys
+
+# ``@dataclass(slots=True)`` requires Python 3.10+. On older interpreters the
+# dataclasses fall back to a regular per-instance ``__dict__``.
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -221,7 +221,8 @@ class FluentVisionX(LiquidHandlerBackend if PYLABROBOT_AVAILABLE else object):
         self._channel_opens_handler = None
         self._mode_changed_handler = None
         self._error_handler = None
-        self._channel_available_event = None
+        self._channel_available_event = None  # asyncio.Event set on ChannelOpens
+        self._channel_event_loop = None  # Loop that owns _channel_available_event
         self._progress_handler = None
 
         # State management
@@ -396,9 +397,7 @@ class FluentVisionX(LiquidHandlerBackend if PYLABROBOT_AVAILABLE else object):
             return True
 
         except Exception as e:
-            self.logger.error(f"Failed to create FluentControl: {e}")
-            import traceback
-            traceback.print_exc()
+            self.logger.exception(f"Failed to create FluentControl: {e}")
             return False
 
     def _get_runtime(self):
@@ -424,9 +423,7 @@ class FluentVisionX(LiquidHandlerBackend if PYLABROBOT_AVAILABLE else object):
             return True
 
         except Exception as e:
-            self.logger.error(f"Failed to get RuntimeController: {e}")
-            import traceback
-            traceback.print_exc()
+            self.logger.exception(f"Failed to get RuntimeController: {e}")
             return False
     
     def _handle_recovery_mode(self):
@@ -824,9 +821,7 @@ class FluentVisionX(LiquidHandlerBackend if PYLABROBOT_AVAILABLE else object):
                 return False
 
         except Exception as e:
-            self.logger.error(f"Failed to register API callback: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self.logger.exception(f"Failed to register API callback: {e}")
             return False
 
     def _subscribe_to_runtime_events(self):
@@ -884,8 +879,7 @@ class FluentVisionX(LiquidHandlerBackend if PYLABROBOT_AVAILABLE else object):
                         self.backend._register_api_callback(channel)
 
                         # Set the event to signal channel is ready
-                        if hasattr(self.backend, '_channel_available_event') and self.backend._channel_available_event:
-                            self.backend._channel_available_event.set()
+                        self.backend._signal_channel_available()
 
                     except Exception as e:
                         self.backend.logger.error(f"Error in channel opens handler: {e}")
@@ -968,8 +962,7 @@ class FluentVisionX(LiquidHandlerBackend if PYLABROBOT_AVAILABLE else object):
                         self.current_execution_channel = channel
                         if channel not in self._open_execution_channels:
                             self._open_execution_channels.append(channel)
-                        if hasattr(self, '_channel_available_event') and self._channel_available_event:
-                            self._channel_available_event.set()
+                        self._signal_channel_available()
 
                     self.runtime.ChannelOpens += on_channel_opens
                     self._channel_opens_handler = on_channel_opens
@@ -1526,9 +1519,7 @@ class FluentVisionX(LiquidHandlerBackend if PYLABROBOT_AVAILABLE else object):
                 self.set_simulation_speed(1.0)
 
         except Exception as e:
-            self.logger.error(f"Failed to connect: {e}")
-            import traceback
-            traceback.print_exc()
+            self.logger.exception(f"Failed to connect: {e}")
             self._last_error = str(e)
             self._current_state = FluentState.ERROR
             raise TecanError(f"Failed to connect: {str(e)}", "VisionX", 1)
@@ -1773,9 +1764,7 @@ class FluentVisionX(LiquidHandlerBackend if PYLABROBOT_AVAILABLE else object):
             return method_list
 
         except Exception as e:
-            self.logger.error(f"Could not get available methods: {e}")
-            import traceback
-            traceback.print_exc()
+            self.logger.exception(f"Could not get available methods: {e}")
             return []
 
     def prepare_method(self, method_name: str) -> bool:
@@ -1802,9 +1791,7 @@ class FluentVisionX(LiquidHandlerBackend if PYLABROBOT_AVAILABLE else object):
             return True
 
         except Exception as e:
-            self.logger.error(f"Error preparing method: {e}")
-            import traceback
-            traceback.print_exc()
+            self.logger.exception(f"Error preparing method: {e}")
             self._last_error = str(e)
             raise TecanError(f"Failed to prepare method: {str(e)}", "VisionX", 1)
 
@@ -2108,9 +2095,7 @@ class FluentVisionX(LiquidHandlerBackend if PYLABROBOT_AVAILABLE else object):
                         except:
                             pass
                     
-                    self.logger.error("=" * 60)
-                    import traceback
-                    self.logger.error(traceback.format_exc())
+                    self.logger.exception("RunMethod() failed")
                     self.logger.error("=" * 60)
                     raise
                 
@@ -2304,7 +2289,7 @@ class FluentVisionX(LiquidHandlerBackend if PYLABROBOT_AVAILABLE else object):
             self.logger.error("=" * 60)
             self.logger.error(f"FAILED TO RUN METHOD: {method_name}")
             self.logger.error("=" * 60)
-            self.logger.error(f"Error: {e}")
+            self.logger.exception(f"Error: {e}")
             if self._last_error:
                 self.logger.error(f"Last runtime error: {self._last_error}")
             
@@ -2317,9 +2302,27 @@ class FluentVisionX(LiquidHandlerBackend if PYLABROBOT_AVAILABLE else object):
                     pass
             
             self._current_state = FluentState.ERROR
-            import traceback
-            traceback.print_exc()
     
+    def _signal_channel_available(self) -> None:
+        """Wake a pending wait_for_channel(). Safe to call from COM event threads."""
+        event = self._channel_available_event
+        loop = self._channel_event_loop
+        if event is None or loop is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(event.set)
+
+    async def _wait_for_channel_event(self, delay: float) -> None:
+        """Sleep up to ``delay`` seconds, returning early if a channel opens."""
+        event = self._channel_available_event
+        if event is None:
+            await asyncio.sleep(delay)
+            return
+        try:
+            await asyncio.wait_for(event.wait(), delay)
+        except asyncio.TimeoutError:
+            return
+        event.clear()
+
     async def wait_for_channel(self, timeout: int = 60) -> bool:
         """Wait for API execution channel to open and be ready.
         
@@ -2358,6 +2361,8 @@ class FluentVisionX(LiquidHandlerBackend if PYLABROBOT_AVAILABLE else object):
                     return True
         
         self.logger.info(f"Waiting for API channel (timeout: {timeout}s)...")
+        self._channel_event_loop = asyncio.get_running_loop()
+        self._channel_available_event = asyncio.Event()
         self.logger.info(f"Current channel: {self.current_execution_channel}")
         self.logger.info(f"Open channels: {len(self._open_execution_channels)}")
         
@@ -2377,8 +2382,8 @@ class FluentVisionX(LiquidHandlerBackend if PYLABROBOT_AVAILABLE else object):
                 self.logger.info("Method is running - channel should be available. Attempting immediate detection...")
         
         # Wait a moment for COM events to fire (channel might open via COM event)
-        self.logger.info("Waiting 2 seconds for COM events (ChannelOpens event) to fire...")
-        await asyncio.sleep(2)
+        self.logger.info("Waiting up to 2 seconds for COM events (ChannelOpens event) to fire...")
+        await self._wait_for_channel_event(2)
         
         # Check if channel was set by COM event during the wait
         if self.current_execution_channel is not None:
@@ -2707,7 +2712,8 @@ class FluentVisionX(LiquidHandlerBackend if PYLABROBOT_AVAILABLE else object):
                         self.logger.info("✓ API channel is ready!")
                         return True
             
-            await asyncio.sleep(0.5)
+            # Poll again in 0.5s, or as soon as a ChannelOpens event arrives
+            await self._wait_for_channel_event(0.5)
         
         self.logger.warning(f"Timeout waiting for API channel after {timeout}s")
         return False
@@ -2986,8 +2992,7 @@ class FluentVisionX(LiquidHandlerBackend if PYLABROBOT_AVAILABLE else object):
                     self.logger.error(f"Error executing command: {e}")
                     self.logger.error(f"Command type: {type(command)}")
                     self.logger.error(f"Channel type: {type(channel)}")
-                    import traceback
-                    traceback.print_exc()
+                    self.logger.exception("Command execution failed")
                     raise TecanError(f"Command execution failed: {str(e)}", "VisionX", 1)
             else:
                 self.logger.error(f"Channel exists but is not alive (IsAlive: {is_alive})")
@@ -3156,9 +3161,7 @@ class FluentVisionX(LiquidHandlerBackend if PYLABROBOT_AVAILABLE else object):
             self.logger.info(f"✓ Got tips: {diti_type}")
             
         except Exception as e:
-            self.logger.error(f"Failed to get tips: {e}")
-            import traceback
-            traceback.print_exc()
+            self.logger.exception(f"Failed to get tips: {e}")
             raise TecanError(f"Failed to get tips: {str(e)}", "VisionX", 1)
 
     def drop_tips_to_location(self, labware: str, tip_indices: Optional[List[int]] = None):
@@ -3186,9 +3189,7 @@ class FluentVisionX(LiquidHandlerBackend if PYLABROBOT_AVAILABLE else object):
             self.logger.info(f"✓ Dropped tips to {labware}")
             
         except Exception as e:
-            self.logger.error(f"Failed to drop tips: {e}")
-            import traceback
-            traceback.print_exc()
+            self.logger.exception(f"Failed to drop tips: {e}")
             raise TecanError(f"Failed to drop tips: {str(e)}", "VisionX", 1)
 
     # ========================================================================
@@ -3238,9 +3239,7 @@ class FluentVisionX(LiquidHandlerBackend if PYLABROBOT_AVAILABLE else object):
             self.logger.info(f"✓ Aspirated {volumes}µL from {labware}")
             
         except Exception as e:
-            self.logger.error(f"Failed to aspirate: {e}")
-            import traceback
-            traceback.print_exc()
+            self.logger.exception(f"Failed to aspirate: {e}")
             raise TecanError(f"Failed to aspirate: {str(e)}", "VisionX", 1)
 
     def dispense_volume(
@@ -3286,9 +3285,7 @@ class FluentVisionX(LiquidHandlerBackend if PYLABROBOT_AVAILABLE else object):
             self.logger.info(f"✓ Dispensed {volumes}µL to {labware}")
             
         except Exception as e:
-            self.logger.error(f"Failed to dispense: {e}")
-            import traceback
-            traceback.print_exc()
+            self.logger.exception(f"Failed to dispense: {e}")
             raise TecanError(f"Failed to dispense: {str(e)}", "VisionX", 1)
 
     # ========================================================================
@@ -133,7 +133,36 @@ def list_available_liquid_classes(backend) -> List[str]:
     return liquid_classes
 
 
-def print_configuration_summary(backend) -> None:
+def get_configuration_summary(backend) -> Dict[str, Any]:
+    """Get the available FluentControl configuration without printing it.
+    
+    Args:
+        backend: FluentVisionX backend instance (must be connected)
+    
+    Returns:
+        Dict with the runtime "status", the available "labware" and the
+        available "liquid_classes". The lists are empty (and the status
+        None) if they could not be retrieved.
+    """
+    config: Dict[str, Any] = {"status": None, "labware": [], "liquid_classes": []}
+    
+    if not backend or not backend.runtime:
+        return config
+    
+    # Runtime status
+    try:
+        if hasattr(backend.runtime, 'GetFluentStatus'):
+            config["status"] = backend.runtime.GetFluentStatus()
+    except:
+        pass
+    
+    config["labware"] = list_available_labware(backend)
+    config["liquid_classes"] = list_available_liquid_classes(backend)
+    
+    return config
+
+
+def print_configuration_summary(backend, summary: Optional[Dict[str, Any]] = None) -> None:
     """Print a summary of available FluentControl configuration.
     
     This includes:
@@ -144,6 +173,8 @@ def print_configuration_summary(backend) -> None:
     
     Args:
         backend: FluentVisionX backend instance (must be connected)
+        summary: Result of get_configuration_summary() to print instead of
+            querying FluentControl again (optional)
     """
     print("=" * 60)
     print("FluentControl Configuration Summary")
@@ -153,17 +184,16 @@ def print_configuration_summary(backend) -> None:
         print("ERROR: Backend not connected")
         return
     
+    if summary is None:
+        summary = get_configuration_summary(backend)
+    
     # Runtime status
-    try:
-        if hasattr(backend.runtime, 'GetFluentStatus'):
-            status = backend.runtime.GetFluentStatus()
-            print(f"\nRuntime Status: {status}")
-    except:
-        pass
+    if summary["status"] is not None:
+        print(f"\nRuntime Status: {summary['status']}")
     
     # Available labware
     print("\nAvailable Labware:")
-    labware = list_available_labware(backend)
+    labware = summary["labware"]
     if labware:
         for lw in labware:
             print(f"  - {lw}")
@@ -173,7 +203,7 @@ def print_configuration_summary(backend) -> None:
     
     # Available liquid classes
     print("\nAvailable Liquid Classes:")
-    liquid_classes = list_available_liquid_classes(backend)
+    liquid_classes = summary["liquid_classes"]
     if liquid_classes:
         for lc in liquid_classes:
             print(f"  - {lc}")
@@ -185,5 +215,3 @@ def print_configuration_summary(backend) -> None:
     print("Note: Labware names must match exactly (case-sensitive)")
     print("      Liquid class names must match exactly (case-sensitive)")
     print("=" * 60)
-
-
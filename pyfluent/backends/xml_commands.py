@@ -3,7 +3,8 @@ XML command generators for Tecan Fluent API.
 These generate the exact XML structures that work with the Tecan VisionX API.
 """
 
-from typing import List, Optional, Union
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union
 
 # Device aliases
 FCA_DEVICE_ALIAS = "Instrument=1/Device=LIHA:1"
@@ -11,6 +12,42 @@ MCA_DEVICE_ALIAS = "Instrument=1/Device=MCA96:1"
 RGA_DEVICE_ALIAS = "Instrument=1/Device=RGA:1"
 
 
+# The memoized builders below only take text as it appears in the XML.
+# Values such as 50 and 50.0 compare equal but render differently, so
+# caching on the raw arguments would let one call reuse another's XML.
+
+def _rendered(values) -> Tuple[str, ...]:
+    """Render a sequence argument for a memoized builder."""
+    return tuple(map(str, values))
+
+
+def _well_selection(well_offsets, count: int) -> Tuple[str, str]:
+    """Return the serialized well indexes and selected wells string for a pipetting command."""
+    # Serialized well indexes (semicolon-separated)
+    serialized_wells = ';'.join([str(wo) for wo in well_offsets]) + ';'
+    
+    # Selected wells string
+    if len(set(well_offsets)) == 1:
+        # All same well - calculate proper well name
+        offset = well_offsets[0]
+        col = offset // 8  # Column-major: 8 rows per column
+        row = offset % 8
+        row_letter = chr(65 + row)  # A=0, B=1, etc.
+        well_name = f"{row_letter}{col+1}"
+        selected_wells = f"{count} * {well_name}"
+    else:
+        # Multiple different wells - Tecan uses column-major ordering
+        well_names = []
+        for offset in well_offsets:
+            col = offset // 8  # Column-major: 8 rows per column
+            row = offset % 8
+            row_letter = chr(65 + row)
+            well_names.append(f"{row_letter}{col+1}")
+        selected_wells = ";".join(well_names)
+    
+    return serialized_wells, selected_wells
+
+
 def make_get_tips_xml(
     diti_type: str = "TOOLTYPE:LiHa.TecanDiTi/TOOLNAME:FCA, 200ul",
     airgap_volume: int = 10,
@@ -29,8 +66,13 @@ def make_get_tips_xml(
         XML string for GetTips command
     """
     if tip_indices is None:
-        tip_indices = list(range(8))
-    
+        tip_indices = range(8)
+    return _get_tips_xml(str(diti_type), str(airgap_volume), str(airgap_speed), _rendered(tip_indices))
+
+
+@lru_cache(maxsize=256)
+def _get_tips_xml(diti_type, airgap_volume, airgap_speed, tip_indices) -> str:
+    """Build and memoize the XML for :func:`make_get_tips_xml` from rendered arguments."""
     tips_xml = '\n'.join([
         f'                                                <Object Type="System.Int32"><int>{i}</int></Object>'
         for i in tip_indices
@@ -112,36 +154,24 @@ def make_aspirate_xml(
     if well_offsets is None:
         well_offsets = [0] * len(volumes)
     if tip_indices is None:
-        tip_indices = list(range(len(volumes)))
-    
+        tip_indices = range(len(volumes))
+    serialized_wells, selected_wells = _well_selection(well_offsets, len(volumes))
+    return _aspirate_xml(
+        str(labware), _rendered(volumes), str(liquid_class),
+        serialized_wells, selected_wells, str(well_offsets[0]), _rendered(tip_indices)
+    )
+
+
+@lru_cache(maxsize=256)
+def _aspirate_xml(labware, volumes, liquid_class, serialized_wells, selected_wells,
+                well_offset, tip_indices) -> str:
+    """Build and memoize the XML for :func:`make_aspirate_xml` from rendered arguments."""
     # Volumes array
     volumes_xml = '\n'.join([
         f'                            <Object Type="System.String"><string>{v}</string></Object>'
         for v in volumes
     ])
     
-    # Serialized well indexes (semicolon-separated)
-    serialized_wells = ';'.join([str(wo) for wo in well_offsets]) + ';'
-    
-    # Selected wells string
-    if len(set(well_offsets)) == 1:
-        # All same well - calculate proper well name
-        offset = well_offsets[0]
-        col = offset // 8  # Column-major: 8 rows per column
-        row = offset % 8
-        row_letter = chr(65 + row)  # A=0, B=1, etc.
-        well_name = f"{row_letter}{col+1}"
-        selected_wells = f"{len(volumes)} * {well_name}"
-    else:
-        # Multiple different wells - Tecan uses column-major ordering
-        well_names = []
-        for offset in well_offsets:
-            col = offset // 8  # Column-major: 8 rows per column
-            row = offset % 8
-            row_letter = chr(65 + row)
-            well_names.append(f"{row_letter}{col+1}")
-        selected_wells = ";".join(well_names)
-    
     # Tip indices
     tips_xml = '\n'.join([
         f'                                            <Object Type="System.Int32"><int>{i}</int></Object>'
@@ -173,7 +203,7 @@ def make_aspirate_xml(
                             <LihaScriptCommandUsingWellSelectionBaseDataV1>
                                 <SerializedWellIndexes>{serialized_wells}</SerializedWellIndexes>
                                 <SelectedWellsString>{selected_wells}</SelectedWellsString>
-                                <WellOffset>{well_offsets[0]}</WellOffset>
+                                <WellOffset>{well_offset}</WellOffset>
                                 <Data Type="Tecan.Core.Instrument.Devices.LiHa.Scripting.LiHaScriptCommandUsingTipSelectionBaseDataV1">
                                     <LiHaScriptCommandUsingTipSelectionBaseDataV1>
                                         <SerializedTipsIndexes></SerializedTipsIndexes>
@@ -250,33 +280,23 @@ def make_dispense_xml(
     if well_offsets is None:
         well_offsets = [0] * len(volumes)
     if tip_indices is None:
-        tip_indices = list(range(len(volumes)))
-    
+        tip_indices = range(len(volumes))
+    serialized_wells, selected_wells = _well_selection(well_offsets, len(volumes))
+    return _dispense_xml(
+        str(labware), _rendered(volumes), str(liquid_class),
+        serialized_wells, selected_wells, str(well_offsets[0]), _rendered(tip_indices)
+    )
+
+
+@lru_cache(maxsize=256)
+def _dispense_xml(labware, volumes, liquid_class, serialized_wells, selected_wells,
+                well_offset, tip_indices) -> str:
+    """Build and memoize the XML for :func:`make_dispense_xml` from rendered arguments."""
     volumes_xml = '\n'.join([
         f'                            <Object Type="System.String"><string>{v}</string></Object>'
         for v in volumes
     ])
     
-    serialized_wells = ';'.join([str(wo) for wo in well_offsets]) + ';'
-    
-    if len(set(well_offsets)) == 1:
-        # All same well - calculate proper well name
-        offset = well_offsets[0]
-        col = offset // 8  # Column-major: 8 rows per column
-        row = offset % 8
-        row_letter = chr(65 + row)  # A=0, B=1, etc.
-        well_name = f"{row_letter}{col+1}"
-        selected_wells = f"{len(volumes)} * {well_name}"
-    else:
-        # Multiple different wells - Tecan uses column-major ordering
-        well_names = []
-        for offset in well_offsets:
-            col = offset // 8  # Column-major: 8 rows per column
-            row = offset % 8
-            row_letter = chr(65 + row)
-            well_names.append(f"{row_letter}{col+1}")
-        selected_wells = ";".join(well_names)
-    
     tips_xml = '\n'.join([
         f'                                            <Object Type="System.Int32"><int>{i}</int></Object>'
         for i in tip_indices
@@ -308,7 +328,7 @@ def make_dispense_xml(
                             <LihaScriptCommandUsingWellSelectionBaseDataV1>
                                 <SerializedWellIndexes>{serialized_wells}</SerializedWellIndexes>
                                 <SelectedWellsString>{selected_wells}</SelectedWellsString>
-                                <WellOffset>{well_offsets[0]}</WellOffset>
+                                <WellOffset>{well_offset}</WellOffset>
                                 <Data Type="Tecan.Core.Instrument.Devices.LiHa.Scripting.LiHaScriptCommandUsingTipSelectionBaseDataV1">
                                     <LiHaScriptCommandUsingTipSelectionBaseDataV1>
                                         <SerializedTipsIndexes></SerializedTipsIndexes>
@@ -377,8 +397,13 @@ def make_drop_tips_xml(
         XML string for DropTips command
     """
     if tip_indices is None:
-        tip_indices = list(range(8))
-    
+        tip_indices = range(8)
+    return _drop_tips_xml(str(labware), _rendered(tip_indices))
+
+
+@lru_cache(maxsize=256)
+def _drop_tips_xml(labware, tip_indices) -> str:
+    """Build and memoize the XML for :func:`make_drop_tips_xml` from rendered arguments."""
     tips_xml = '\n'.join([
         f'                                            <Object Type="System.Int32"><int>{i}</int></Object>'
         for i in tip_indices
@@ -5,13 +5,16 @@ This module provides classes for creating and executing liquid handling protocol
 including aspirate, dispense, tip handling, and worklist generation.
 """
 
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Union
 from enum import Enum
 import csv
 import io
 import asyncio
+import logging
 
+from ._compat import DATACLASS_SLOTS
 from .constants import (
     DEFAULT_LIQUID_CLASS,
     DEFAULT_FCA_WASTE,
@@ -19,6 +22,11 @@ from .constants import (
     ROWS_96_WELL,
 )
 
+logger = logging.getLogger("FluentProtocol")
+
+# Emit an INFO progress line every this many executed steps
+_PROGRESS_LOG_INTERVAL = 100
+
 
 class CommandType(Enum):
     """Types of protocol commands."""
@@ -50,7 +58,7 @@ class ProtocolCommand:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Transfer:
     """Represents a liquid transfer operation."""
     source_labware: str
@@ -63,12 +71,17 @@ class Transfer:
     @property
     def source_well_offset(self) -> int:
         """Get source well as numeric offset."""
-        return well_name_to_offset(self.source_well)
+        well = self.source_well
+        return well_name_to_offset(well) if isinstance(well, str) else well
     
     @property
     def dest_well_offset(self) -> int:
         """Get destination well as numeric offset."""
-        return well_name_to_offset(self.dest_well)
+        well = self.dest_well
+        return well_name_to_offset(well) if isinstance(well, str) else well
+
+
+_ORD_A = 65  # ord('A')
 
 
 def well_name_to_offset(well_name: str) -> int:
@@ -79,6 +92,17 @@ def well_name_to_offset(well_name: str) -> int:
     if not well_name:
         return 0
     
+    # Fast path for the common letter + number form (e.g. 'A1', 'b12'):
+    # avoids allocating upper-cased/stripped copies of the name
+    row_code = ord(well_name[0])
+    if 97 <= row_code <= 122:  # lower-case ASCII letter
+        row_code -= 32
+    if 65 <= row_code <= 90:
+        try:
+            return (int(well_name[1:]) - 1) * 8 + (row_code - _ORD_A)
+        except ValueError:
+            pass  # Fall back to the normalizing parser below
+    
     well_name = well_name.upper().strip()
     
     # Handle numeric offset directly
@@ -88,7 +112,7 @@ def well_name_to_offset(well_name: str) -> int:
     # Parse letter + number format (e.g., A1, B12)
     row_letter = well_name[0]
     col_num = int(well_name[1:]) - 1  # Convert to 0-based
-    row_num = ord(row_letter) - ord('A')
+    row_num = ord(row_letter) - _ORD_A
     
     # Column-major ordering (8 rows per column for 96-well)
     return col_num * 8 + row_num
@@ -108,7 +132,7 @@ def offset_to_well_name(offset: int, rows: int = ROWS_96_WELL) -> str:
     """
     col = offset // rows
     row = offset % rows
-    row_letter = chr(ord('A') + row)
+    row_letter = chr(_ORD_A + row)
     return f"{row_letter}{col + 1}"
 
 
@@ -189,6 +213,27 @@ class Protocol:
     # LIQUID HANDLING
     # ========================================================================
     
+    @staticmethod
+    def _pipetting_command(
+        command_type: CommandType,
+        labware: str,
+        well: str,
+        well_offset: int,
+        volume: float,
+        liquid_class: str
+    ) -> ProtocolCommand:
+        """Build an aspirate/dispense command with an already resolved offset."""
+        return ProtocolCommand(
+            command_type=command_type,
+            parameters={
+                "labware": labware,
+                "well": well,
+                "volume": int(volume),
+                "liquid_class": liquid_class,
+                "well_offset": well_offset
+            }
+        )
+    
     def aspirate(
         self,
         labware: str,
@@ -205,17 +250,14 @@ class Protocol:
             volume: Volume to aspirate in µL
             liquid_class: Liquid class (uses default if not specified)
         """
-        cmd = ProtocolCommand(
-            command_type=CommandType.ASPIRATE,
-            parameters={
-                "labware": labware,
-                "well": well,
-                "volume": int(volume),
-                "liquid_class": liquid_class or self.liquid_class,
-                "well_offset": well_name_to_offset(well) if isinstance(well, str) else well
-            }
-        )
-        self.commands.append(cmd)
+        self.commands.append(self._pipetting_command(
+            CommandType.ASPIRATE,
+            labware,
+            well,
+            well_name_to_offset(well) if isinstance(well, str) else well,
+            volume,
+            liquid_class or self.liquid_class
+        ))
         return self
     
     def dispense(
@@ -234,17 +276,14 @@ class Protocol:
             volume: Volume to dispense in µL
             liquid_class: Liquid class (uses default if not specified)
         """
-        cmd = ProtocolCommand(
-            command_type=CommandType.DISPENSE,
-            parameters={
-                "labware": labware,
-                "well": well,
-                "volume": int(volume),
-                "liquid_class": liquid_class or self.liquid_class,
-                "well_offset": well_name_to_offset(well) if isinstance(well, str) else well
-            }
-        )
-        self.commands.append(cmd)
+        self.commands.append(self._pipetting_command(
+            CommandType.DISPENSE,
+            labware,
+            well,
+            well_name_to_offset(well) if isinstance(well, str) else well,
+            volume,
+            liquid_class or self.liquid_class
+        ))
         return self
     
     def transfer(
@@ -275,21 +314,78 @@ class Protocol:
         if new_tip and not self.current_tips_loaded:
             self.get_tips()
         
+        # Build the transfer first so each well is parsed only once
+        transfer = Transfer(source_labware, source_well, dest_labware, dest_well, volume, lc)
+        make = self._pipetting_command
+        
         # Aspirate
-        self.aspirate(source_labware, source_well, volume, lc)
+        self.commands.append(make(
+            CommandType.ASPIRATE, source_labware, source_well, transfer.source_well_offset, volume, lc
+        ))
         
         # Dispense
-        self.dispense(dest_labware, dest_well, volume, lc)
+        self.commands.append(make(
+            CommandType.DISPENSE, dest_labware, dest_well, transfer.dest_well_offset, volume, lc
+        ))
         
         # Track transfer
-        self.transfers.append(Transfer(
-            source_labware=source_labware,
-            source_well=source_well,
-            dest_labware=dest_labware,
-            dest_well=dest_well,
-            volume=volume,
-            liquid_class=lc
-        ))
+        self.transfers.append(transfer)
+        
+        return self
+    
+    def bulk_transfer(
+        self,
+        source_labware: str,
+        source_wells: List[str],
+        dest_labware: str,
+        dest_wells: List[str],
+        volumes: Union[float, List[float]],
+        liquid_class: Optional[str] = None
+    ):
+        """
+        Add many transfers (aspirate + dispense pairs) in one call.
+        
+        Produces the same commands as calling transfer() for each pair of
+        wells, but builds them up front and appends them in a single batch.
+        
+        Args:
+            source_labware: Name of the source labware
+            source_wells: Source well names
+            dest_labware: Name of the destination labware
+            dest_wells: Destination well names (paired with source_wells)
+            volumes: Volume per transfer in µL, or one volume per well pair
+            liquid_class: Liquid class
+        """
+        if len(source_wells) != len(dest_wells):
+            raise ValueError("source_wells and dest_wells must have the same length")
+        if isinstance(volumes, (int, float)):
+            volumes = [volumes] * len(source_wells)
+        elif len(volumes) != len(source_wells):
+            raise ValueError("volumes must be a single value or match the number of wells")
+        
+        lc = liquid_class or self.liquid_class
+        
+        # Get tips if needed
+        if source_wells and not self.current_tips_loaded:
+            self.get_tips()
+        
+        # Each transfer's well offsets are parsed once, for its commands
+        transfers = [
+            Transfer(source_labware, src, dest_labware, dst, vol, lc)
+            for src, dst, vol in zip(source_wells, dest_wells, volumes)
+        ]
+        make = self._pipetting_command
+        
+        # Aspirate/dispense pairs, appended to self.commands in one batch
+        self.commands.extend([
+            command
+            for t in transfers
+            for command in (
+                make(CommandType.ASPIRATE, source_labware, t.source_well, t.source_well_offset, t.volume, lc),
+                make(CommandType.DISPENSE, dest_labware, t.dest_well, t.dest_well_offset, t.volume, lc),
+            )
+        ])
+        self.transfers.extend(transfers)
         
         return self
     
@@ -319,21 +415,29 @@ class Protocol:
         if not self.current_tips_loaded:
             self.get_tips()
         
+        make = self._pipetting_command
+        
         # Aspirate total volume
         total_volume = volume * len(dest_wells)
-        self.aspirate(source_labware, source_well, total_volume, lc)
+        self.commands.append(make(
+            CommandType.ASPIRATE,
+            source_labware,
+            source_well,
+            well_name_to_offset(source_well) if isinstance(source_well, str) else source_well,
+            total_volume,
+            lc
+        ))
         
         # Dispense to each well
-        for well in dest_wells:
-            self.dispense(dest_labware, well, volume, lc)
-            self.transfers.append(Transfer(
-                source_labware=source_labware,
-                source_well=source_well,
-                dest_labware=dest_labware,
-                dest_well=well,
-                volume=volume,
-                liquid_class=lc
-            ))
+        transfers = [
+            Transfer(source_labware, source_well, dest_labware, well, volume, lc)
+            for well in dest_wells
+        ]
+        self.commands.extend([
+            make(CommandType.DISPENSE, dest_labware, t.dest_well, t.dest_well_offset, volume, lc)
+            for t in transfers
+        ])
+        self.transfers.extend(transfers)
         
         return self
     
@@ -451,12 +555,15 @@ class Protocol:
         if not be:
             raise RuntimeError("No backend available. Provide a backend or set self.backend")
         
-        print(f"Executing protocol: {self.name}")
-        print(f"Total commands: {len(self.commands)}")
-        print("-" * 40)
+        total = len(self.commands)
+        logger.info("Executing protocol: %s (%d commands)", self.name, total)
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         
         for i, cmd in enumerate(self.commands):
-            print(f"Step {i+1}/{len(self.commands)}: {cmd.command_type.value}")
+            if debug_enabled:
+                logger.debug("Step %d/%d: %s", i + 1, total, cmd.command_type.value)
+            elif i % _PROGRESS_LOG_INTERVAL == 0:
+                logger.info("Step %d/%d: %s", i + 1, total, cmd.command_type.value)
             
             try:
                 if cmd.command_type == CommandType.GET_TIPS:
@@ -513,21 +620,35 @@ class Protocol:
                 # This is especially important in simulation mode
                 await asyncio.sleep(0.5)
                 
-                print(f"  [OK]")
-                
-            except Exception as e:
-                print(f"  [ERROR] {e}")
-                import traceback
-                traceback.print_exc()
+            except Exception:
+                logger.exception("Step %d/%d (%s) failed", i + 1, total, cmd.command_type.value)
                 raise
         
-        print("-" * 40)
-        print(f"Protocol complete!")
+        logger.info("Protocol complete: %s", self.name)
     
     # ========================================================================
     # WORKLIST / CSV EXPORT
     # ========================================================================
     
+    def _worklist_rows(self):
+        """Yield one worklist CSV row per exportable command."""
+        for cmd in self.commands:
+            command_type = cmd.command_type
+            params = cmd.parameters
+            if command_type is CommandType.ASPIRATE or command_type is CommandType.DISPENSE:
+                yield [
+                    "A" if command_type is CommandType.ASPIRATE else "D",
+                    params["labware"],
+                    params["well"],
+                    params["volume"],
+                    params["liquid_class"],
+                    ""
+                ]
+            elif command_type is CommandType.GET_TIPS:
+                yield ["G", "", "", "", "", params.get("tip_type", "")]
+            elif command_type is CommandType.DROP_TIPS:
+                yield ["DROP", params.get("waste_location", ""), "", "", "", ""]
+    
     def to_worklist_csv(self) -> str:
         """
         Export protocol as a worklist CSV.
@@ -540,30 +661,7 @@ class Protocol:
         
         # Header
         writer.writerow(["Command", "Labware", "Well", "Volume", "LiquidClass", "Extra"])
-        
-        for cmd in self.commands:
-            if cmd.command_type == CommandType.ASPIRATE:
-                writer.writerow([
-                    "A",  # Aspirate
-                    cmd.parameters["labware"],
-                    cmd.parameters["well"],
-                    cmd.parameters["volume"],
-                    cmd.parameters["liquid_class"],
-                    ""
-                ])
-            elif cmd.command_type == CommandType.DISPENSE:
-                writer.writerow([
-                    "D",  # Dispense
-                    cmd.parameters["labware"],
-                    cmd.parameters["well"],
-                    cmd.parameters["volume"],
-                    cmd.parameters["liquid_class"],
-                    ""
-                ])
-            elif cmd.command_type == CommandType.GET_TIPS:
-                writer.writerow(["G", "", "", "", "", cmd.parameters.get("tip_type", "")])
-            elif cmd.command_type == CommandType.DROP_TIPS:
-                writer.writerow(["DROP", cmd.parameters.get("waste_location", ""), "", "", "", ""])
+        writer.writerows(self._worklist_rows())
         
         return output.getvalue()
     
@@ -587,9 +685,7 @@ class Protocol:
         lines.append(f"Total transfers: {len(self.transfers)}")
         
         # Count by command type
-        counts = {}
-        for cmd in self.commands:
-            counts[cmd.command_type.value] = counts.get(cmd.command_type.value, 0) + 1
+        counts = Counter(cmd.command_type.value for cmd in self.commands)
         
         lines.append("\nCommands by type:")
         for cmd_type, count in sorted(counts.items()):
@@ -14,10 +14,16 @@ Where:
   - <format> = SBS (standard format)
 """
 
+import re
+import sys
+from functools import lru_cache
+
 
 class FCA:
     """Fixed Channel Arm (FCA) tip types - typically 8 channels."""
     
+    __slots__ = ()
+    
     # Filtered tips
     TIPS_50UL_FILTERED = "TOOLTYPE:LiHa.TecanDiTi/TOOLNAME:FCA, 50ul Filtered SBS"
     TIPS_200UL_FILTERED = "TOOLTYPE:LiHa.TecanDiTi/TOOLNAME:FCA, 200ul Filtered SBS"
@@ -35,6 +41,8 @@ class FCA:
 class MCA:
     """Multi-Channel Arm (MCA) tip types - typically 96 or 384 channels."""
     
+    __slots__ = ()
+    
     # Filtered tips
     TIPS_150UL_FILTERED = "TOOLTYPE:LiHa.TecanDiTi/TOOLNAME:MCA, 150ul Filtered SBS"
     TIPS_50UL_FILTERED = "TOOLTYPE:LiHa.TecanDiTi/TOOLNAME:MCA, 50ul Filtered SBS"
@@ -51,6 +59,8 @@ class MCA:
 class LiquidClass:
     """Common liquid classes for Tecan Fluent."""
     
+    __slots__ = ()
+    
     WATER_FREE_SINGLE = "Water Free Single"
     WATER_FREE_MULTI = "Water Free Multi"
     WATER_WET = "Water Wet"
@@ -62,7 +72,39 @@ class LiquidClass:
     DEFAULT = WATER_FREE_SINGLE
 
 
+def _registry(cls, include) -> tuple:
+    """Collect (attribute, value) pairs from a namespace class, sorted by name."""
+    return tuple(sorted((name, value) for name, value in vars(cls).items() if include(name)))
+
+
+# Registries used by list_all_tip_types (built once at import)
+_FCA_TIP_TYPES = _registry(FCA, lambda name: name.startswith("TIPS"))
+_MCA_TIP_TYPES = _registry(MCA, lambda name: name.startswith("TIPS"))
+_LIQUID_CLASSES = _registry(LiquidClass, lambda name: not name.startswith("_") and name != "DEFAULT")
+
+
+# Lookup table for get_tip_type: (arm, volume, filtered) -> tip type string
+_TIP_TABLE = {
+    ("fca", "50", True): FCA.TIPS_50UL_FILTERED,
+    ("fca", "200", True): FCA.TIPS_200UL_FILTERED,
+    ("fca", "1000", True): FCA.TIPS_1000UL_FILTERED,
+    ("fca", "50", False): FCA.TIPS_50UL,
+    ("fca", "200", False): FCA.TIPS_200UL,
+    ("fca", "1000", False): FCA.TIPS_1000UL,
+    ("mca", "150", True): MCA.TIPS_150UL_FILTERED,
+    ("mca", "50", True): MCA.TIPS_50UL_FILTERED,
+    ("mca", "150", False): MCA.TIPS_150UL,
+    ("mca", "50", False): MCA.TIPS_50UL,
+}
+
+# Volume used when a name does not mention a known size for its arm
+_DEFAULT_TIP_VOLUME = {"fca": "200", "mca": "150"}
+
+_VOLUME_PATTERN = re.compile(r"\d+")
+
+
 # Helper function to get tip type from user-friendly name
+@lru_cache(maxsize=128)
 def get_tip_type(name: str) -> str:
     """
     Get tip type string from a friendly name.
@@ -75,53 +117,48 @@ def get_tip_type(name: str) -> str:
     """
     name = name.lower().replace("ul", "").replace("µl", "").strip()
     
-    # FCA tips
     if "fca" in name:
-        if "1000" in name:
-            return FCA.TIPS_1000UL_FILTERED if "filter" in name else FCA.TIPS_1000UL
-        elif "50" in name:
-            return FCA.TIPS_50UL_FILTERED if "filter" in name else FCA.TIPS_50UL
-        else:  # Default to 200
-            return FCA.TIPS_200UL_FILTERED if "filter" in name else FCA.TIPS_200UL
-    
-    # MCA tips
+        arm = "fca"
     elif "mca" in name:
-        if "50" in name:
-            return MCA.TIPS_50UL_FILTERED if "filter" in name else MCA.TIPS_50UL
-        else:  # Default to 150
-            return MCA.TIPS_150UL_FILTERED if "filter" in name else MCA.TIPS_150UL
+        arm = "mca"
+    else:
+        return FCA.DEFAULT
     
-    # Default
-    return FCA.DEFAULT
+    filtered = "filter" in name
+    for volume in _VOLUME_PATTERN.findall(name):
+        tip_type = _TIP_TABLE.get((arm, volume, filtered))
+        if tip_type is not None:
+            return tip_type
+    
+    return _TIP_TABLE[(arm, _DEFAULT_TIP_VOLUME[arm], filtered)]
 
 
 def list_all_tip_types():
     """Print all available tip type definitions."""
-    print("\n" + "=" * 60)
-    print("  Available Tip Types")
-    print("=" * 60)
-    
-    print("\nFCA (Fixed Channel Arm) Tips:")
-    print("-" * 40)
-    for attr in dir(FCA):
-        if attr.startswith("TIPS"):
-            print(f"  FCA.{attr}")
-            print(f"    = \"{getattr(FCA, attr)}\"")
-    
-    print("\nMCA (Multi-Channel Arm) Tips:")
-    print("-" * 40)
-    for attr in dir(MCA):
-        if attr.startswith("TIPS"):
-            print(f"  MCA.{attr}")
-            print(f"    = \"{getattr(MCA, attr)}\"")
-    
-    print("\nLiquid Classes:")
-    print("-" * 40)
-    for attr in dir(LiquidClass):
-        if not attr.startswith("_") and attr != "DEFAULT":
-            print(f"  LiquidClass.{attr} = \"{getattr(LiquidClass, attr)}\"")
-    
-    print("\n" + "=" * 60)
+    lines = [
+        "\n" + "=" * 60,
+        "  Available Tip Types",
+        "=" * 60,
+        "\nFCA (Fixed Channel Arm) Tips:",
+        "-" * 40,
+    ]
+    for attr, value in _FCA_TIP_TYPES:
+        lines.append(f"  FCA.{attr}")
+        lines.append(f"    = \"{value}\"")
+    
+    lines.append("\nMCA (Multi-Channel Arm) Tips:")
+    lines.append("-" * 40)
+    for attr, value in _MCA_TIP_TYPES:
+        lines.append(f"  MCA.{attr}")
+        lines.append(f"    = \"{value}\"")
+    
+    lines.append("\nLiquid Classes:")
+    lines.append("-" * 40)
+    for attr, value in _LIQUID_CLASSES:
+        lines.append(f"  LiquidClass.{attr} = \"{value}\"")
+    
+    lines.append("\n" + "=" * 60)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
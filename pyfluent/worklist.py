@@ -9,23 +9,44 @@ operations - you generate the worklist in Python, then run a method
 in FluentControl that reads and executes it.
 """
 
+import io
 import os
 import csv
+import sys
+from itertools import islice
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from enum import Enum
 
+from ._compat import DATACLASS_SLOTS
 from .constants import DEFAULT_LIQUID_CLASS
 
 
+# 96-well names in Tecan column-major order: A1, B1, ..., H1, A2, ..., H12
+_WELLS_96 = [f"{row}{col}" for col in range(1, 13) for row in "ABCDEFGH"]
+
+# Tecan 96-well positions (column-major, 1-based): A1=1, B1=2, ..., H12=96.
+# Plain position strings ("1".."96") map to themselves.
+_WELL_POS: Dict[str, int] = {well: index + 1 for index, well in enumerate(_WELLS_96)}
+_WELL_POS.update((str(position), position) for position in range(1, 97))
+
+# Lines joined per write() when streaming a worklist to a file
+_WRITE_BATCH_LINES = 4096
+
+
+def _intern_label(label):
+    """Intern a rack label so every operation on that rack shares one string."""
+    return sys.intern(label) if type(label) is str else label
+
+
 class WorklistFormat(Enum):
     """Supported worklist formats."""
     GWL = "gwl"  # Tecan GWL format
     CSV = "csv"  # Simple CSV format
     
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class WorklistOperation:
     """A single worklist operation."""
     command: str  # A=Aspirate, D=Dispense, W=Wash, etc.
@@ -46,12 +67,13 @@ class WorklistOperation:
         if self.command == "C":
             # Comment line
             return f"C;{self.comment}"
-        elif self.command == "A":
-            # Aspirate: A;RackLabel;RackID;RackType;Position;TubeID;Volume;LiquidClass;TipType;TipMask;ForcedRackType
-            return f"A;{self.rack_label};{self.rack_id};{self.rack_type};{self.position};{self.tube_id};{self.volume:.1f};{self.liquid_class};{self.tip_type};{self.tip_mask};"
-        elif self.command == "D":
-            # Dispense: D;RackLabel;RackID;RackType;Position;TubeID;Volume;LiquidClass;TipType;TipMask;ForcedRackType
-            return f"D;{self.rack_label};{self.rack_id};{self.rack_type};{self.position};{self.tube_id};{self.volume:.1f};{self.liquid_class};{self.tip_type};{self.tip_mask};"
+        elif self.command == "A" or self.command == "D":
+            # Aspirate / Dispense:
+            # Command;RackLabel;RackID;RackType;Position;TubeID;Volume;LiquidClass;TipType;TipMask;ForcedRackType
+            return (
+                f"{self.command};{self.rack_label};{self.rack_id};{self.rack_type};{self.position};"
+                f"{self.tube_id};{self.volume:.1f};{self.liquid_class};{self.tip_type};{self.tip_mask};"
+            )
         elif self.command == "W":
             # Wash tips
             return f"W;"
@@ -116,6 +138,7 @@ class Worklist:
         self.default_tip_mask = default_tip_mask
         self.operations: List[WorklistOperation] = []
         self.created = datetime.now()
+        self._header_cache = None  # (name, created, header lines) for GWL output
     
     def _well_to_position(self, well: str) -> int:
         """
@@ -125,12 +148,25 @@ class Worklist:
         if isinstance(well, int):
             return well
         
-        well = well.upper().strip()
+        position = _WELL_POS.get(well)
+        if position is not None:
+            return position
+        
         if well.isdigit():
+            # Position number beyond the lookup table
             return int(well)
         
+        if not (well.isalnum() and well.isupper()):
+            # Lower case or padded input - normalize and retry the table
+            well = well.upper().strip()
+            position = _WELL_POS.get(well)
+            if position is not None:
+                return position
+            if well.isdigit():
+                return int(well)
+        
         # Parse A1, B2, etc.
-        row = ord(well[0]) - ord('A')  # 0-based row
+        row = ord(well[0]) - 65  # 0-based row (65 == ord('A'))
         col = int(well[1:]) - 1  # 0-based column
         
         # Column-major: position = col * 8 + row + 1
@@ -164,7 +200,7 @@ class Worklist:
         """
         self.operations.append(WorklistOperation(
             command="A",
-            rack_label=rack_label,
+            rack_label=_intern_label(rack_label),
             position=self._well_to_position(well),
             volume=volume,
             liquid_class=liquid_class or self.liquid_class,
@@ -193,7 +229,7 @@ class Worklist:
         """
         self.operations.append(WorklistOperation(
             command="D",
-            rack_label=rack_label,
+            rack_label=_intern_label(rack_label),
             position=self._well_to_position(well),
             volume=volume,
             liquid_class=liquid_class or self.liquid_class,
@@ -231,6 +267,70 @@ class Worklist:
         self.dispense(dest_rack, dest_well, volume, liquid_class)
         return self
     
+    def extend_transfers(
+        self,
+        source_rack: str,
+        source_wells: List[str],
+        dest_rack: str,
+        dest_wells: List[str],
+        volume: float,
+        liquid_class: Optional[str] = None,
+        new_tip_each: bool = False
+    ):
+        """
+        Add many transfers (aspirate + dispense pairs) in one call.
+        
+        Equivalent to calling transfer() for each source/destination well
+        pair, but resolves defaults once and appends all operations together.
+        
+        Args:
+            source_rack: Source labware label
+            source_wells: Source wells
+            dest_rack: Destination labware label
+            dest_wells: Destination wells (paired with source_wells)
+            volume: Volume per transfer
+            liquid_class: Liquid class
+            new_tip_each: Whether to get new tips before every transfer
+        
+        Raises:
+            ValueError: If source_wells and dest_wells differ in length
+        """
+        if len(source_wells) != len(dest_wells):
+            raise ValueError("source_wells and dest_wells must have the same length")
+        
+        liquid_class = liquid_class or self.liquid_class
+        tip_type = self.tip_type
+        tip_mask = self.default_tip_mask
+        source_rack = _intern_label(source_rack)
+        dest_rack = _intern_label(dest_rack)
+        to_position = self._well_to_position
+        
+        batch = []
+        append = batch.append
+        for source_well, dest_well in zip(source_wells, dest_wells):
+            if new_tip_each:
+                append(WorklistOperation(command="B"))
+            append(WorklistOperation(
+                command="A",
+                rack_label=source_rack,
+                position=to_position(source_well),
+                volume=volume,
+                liquid_class=liquid_class,
+                tip_type=tip_type,
+                tip_mask=tip_mask
+            ))
+            append(WorklistOperation(
+                command="D",
+                rack_label=dest_rack,
+                position=to_position(dest_well),
+                volume=volume,
+                liquid_class=liquid_class,
+                tip_type=tip_type,
+                tip_mask=tip_mask
+            ))
+        self.operations.extend(batch)
+        return self
+    
     def multi_dispense(
         self,
         source_rack: str,
@@ -254,8 +354,24 @@ class Worklist:
         total_volume = volume_per_well * len(dest_wells)
         self.aspirate(source_rack, source_well, total_volume, liquid_class)
         
-        for well in dest_wells:
-            self.dispense(dest_rack, well, volume_per_well, liquid_class)
+        # Build all dispenses up front and append them in one go
+        liquid_class = liquid_class or self.liquid_class
+        tip_type = self.tip_type
+        tip_mask = self.default_tip_mask
+        to_position = self._well_to_position
+        dest_rack = _intern_label(dest_rack)
+        self.operations.extend([
+            WorklistOperation(
+                command="D",
+                rack_label=dest_rack,
+                position=to_position(well),
+                volume=volume_per_well,
+                liquid_class=liquid_class,
+                tip_type=tip_type,
+                tip_mask=tip_mask
+            )
+            for well in dest_wells
+        ])
         
         return self
     
@@ -277,15 +393,13 @@ class Worklist:
             transfer_volume: Volume to transfer between wells
             liquid_class: Liquid class
         """
-        for i in range(len(wells) - 1):
-            self.transfer(
-                rack_label, wells[i],
-                rack_label, wells[i + 1],
-                transfer_volume,
-                liquid_class,
-                new_tip=True
-            )
-        return self
+        return self.extend_transfers(
+            rack_label, wells[:-1],
+            rack_label, wells[1:],
+            transfer_volume,
+            liquid_class,
+            new_tip_each=True
+        )
     
     def wash_tips(self):
         """Add a wash tips operation."""
@@ -304,16 +418,52 @@ class Worklist:
         Returns:
             GWL file content as string
         """
-        lines = []
-        lines.append(f"C;Worklist: {self.name}")
-        lines.append(f"C;Created: {self.created.strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(f"C;Operations: {len(self.operations)}")
-        lines.append("C;")
+        lines = self._gwl_header()
+        lines.extend(self._gwl_lines())
+        return "\n".join(lines)
+    
+    def write_gwl(self, fh):
+        """
+        Stream the worklist in GWL format to an open text file.
         
-        for op in self.operations:
-            lines.append(op.to_gwl_line())
+        Writes the same content as to_gwl() without building it in memory.
         
-        return "\n".join(lines)
+        Args:
+            fh: File-like object opened for writing text
+        """
+        fh.write("\n".join(self._gwl_header()))
+        lines = self._gwl_lines()
+        while True:
+            batch = list(islice(lines, _WRITE_BATCH_LINES))
+            if not batch:
+                break
+            fh.write("\n")
+            fh.write("\n".join(batch))
+    
+    def _gwl_header(self) -> List[str]:
+        """Comment lines written at the top of a GWL worklist."""
+        cache = self._header_cache
+        if cache is None or cache[0] != self.name or cache[1] != self.created:
+            cache = self._header_cache = (self.name, self.created, (
+                f"C;Worklist: {self.name}",
+                f"C;Created: {self.created.strftime('%Y-%m-%d %H:%M:%S')}",
+            ))
+        return [*cache[2], f"C;Operations: {len(self.operations)}", "C;"]
+    
+    def _gwl_lines(self):
+        """Yield the GWL line for each operation (same output as to_gwl_line)."""
+        for op in self.operations:
+            command = op.command
+            if command == "A" or command == "D":
+                yield (
+                    f"{command};{op.rack_label};{op.rack_id};{op.rack_type};{op.position};"
+                    f"{op.tube_id};{op.volume:.1f};{op.liquid_class};{op.tip_type};{op.tip_mask};"
+                )
+            elif command == "C":
+                yield f"C;{op.comment}"
+            else:
+                # W (wash), B (break) and any other single-letter command
+                yield f"{command};"
     
     def to_csv(self) -> str:
         """
@@ -322,7 +472,27 @@ class Worklist:
         Returns:
             CSV file content as string
         """
-        import io
+        header = "Command,RackLabel,Position,Volume,LiquidClass,Comment\r\n"
+        if not self.operations:
+            return header
+        
+        # Fast path: join the fields directly. This matches csv.writer output
+        # as long as no field needs quoting, i.e. the body contains no quote,
+        # no line break other than the row separators and exactly five commas
+        # per row.
+        rows = [
+            f"{op.command},{op.rack_label},{op.position},{op.volume:.1f},{op.liquid_class},{op.comment}"
+            for op in self.operations
+        ]
+        body = "\r\n".join(rows)
+        separators = len(rows) - 1
+        if ('"' not in body
+                and body.count(",") == 5 * len(rows)
+                and body.count("\n") == separators
+                and body.count("\r") == separators):
+            return header + body + "\r\n"
+        
+        # Some field needs quoting - let the csv module handle it
         output = io.StringIO()
         writer = csv.writer(output)
         
@@ -343,25 +513,35 @@ class Worklist:
             format: Worklist format (GWL or CSV)
         """
         # Ensure directory exists
-        os.makedirs(os.path.dirname(filepath) if os.path.dirname(filepath) else ".", exist_ok=True)
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
         
         if format == WorklistFormat.GWL:
-            content = self.to_gwl()
+            with open(filepath, 'w', buffering=1 << 20) as f:
+                self.write_gwl(f)
         else:
-            content = self.to_csv()
-        
-        with open(filepath, 'w') as f:
-            f.write(content)
+            # to_csv() already ends rows with \r\n; don't translate them again
+            with open(filepath, 'w', buffering=1 << 20, newline='') as f:
+                f.write(self.to_csv())
         
         print(f"Saved worklist to: {filepath}")
         return filepath
     
     def get_summary(self) -> str:
         """Get a summary of the worklist."""
-        aspirates = sum(1 for op in self.operations if op.command == "A")
-        dispenses = sum(1 for op in self.operations if op.command == "D")
-        total_asp_vol = sum(op.volume for op in self.operations if op.command == "A")
-        total_disp_vol = sum(op.volume for op in self.operations if op.command == "D")
+        # Counted from self.operations on each call (in a single pass) so the
+        # summary is right even if the list was edited directly
+        aspirates = dispenses = 0
+        total_asp_vol = total_disp_vol = 0
+        for op in self.operations:
+            command = op.command
+            if command == "A":
+                aspirates += 1
+                total_asp_vol += op.volume
+            elif command == "D":
+                dispenses += 1
+                total_disp_vol += op.volume
         
         return f"""
 Worklist: {self.name}
@@ -381,15 +561,16 @@ Operations: {len(self.operations)}
         print(f"\nWorklist: {self.name}")
         print("=" * 60)
         for i, op in enumerate(self.operations):
-            if op.command == "C":
+            command = op.command
+            if command == "C":
                 print(f"  # {op.comment}")
-            elif op.command == "A":
+            elif command == "A":
                 print(f"  {i+1}. ASPIRATE {op.volume:.1f}µL from {op.rack_label} pos {op.position}")
-            elif op.command == "D":
+            elif command == "D":
                 print(f"  {i+1}. DISPENSE {op.volume:.1f}µL to {op.rack_label} pos {op.position}")
-            elif op.command == "W":
+            elif command == "W":
                 print(f"  {i+1}. WASH TIPS")
-            elif op.command == "B":
+            elif command == "B":
                 print(f"  {i+1}. NEW TIPS")
         print("=" * 60)
 
@@ -420,18 +601,10 @@ def create_plate_transfer_worklist(
     wl.comment(f"Transfer from {source_plate} to {dest_plate}")
     
     if wells is None:
-        # Generate all well names for 96-well plate
-        wells = []
-        for col in range(1, 13):
-            for row in "ABCDEFGH":
-                wells.append(f"{row}{col}")
-                if len(wells) >= num_wells:
-                    break
-            if len(wells) >= num_wells:
-                break
+        # First num_wells wells of a 96-well plate (always at least A1)
+        wells = _WELLS_96[:max(num_wells, 1)]
     
-    for well in wells:
-        wl.transfer(source_plate, well, dest_plate, well, volume)
+    wl.extend_transfers(source_plate, wells, dest_plate, wells, volume)
     
     return wl
 
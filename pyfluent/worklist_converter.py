@@ -7,7 +7,8 @@ to Tecan worklist files (GWL/CSV format).
 
 from typing import List, Optional, Union, Dict, Any
 from dataclasses import dataclass
-from .worklist import Worklist, WorklistFormat, WorklistOperation
+from .worklist import Worklist, WorklistFormat, WorklistOperation, _WELL_POS
+from ._compat import DATACLASS_SLOTS
 from .constants import DEFAULT_LIQUID_CLASS, DEFAULT_DITI_TYPE
 
 # Try to import pylabrobot for compatibility, but provide fallbacks for standalone use
@@ -59,7 +60,7 @@ except ImportError:
             pass
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class OperationRecord:
     """Record of a PyLabRobot operation for worklist conversion."""
     operation_type: str  # "pickup", "aspirate", "dispense", "drop"
@@ -96,12 +97,26 @@ def well_to_position(well: Union[str, Well, int]) -> int:
         # Well object - get name
         well_name = well.name if hasattr(well, 'name') else str(well)
     else:
-        well_name = str(well).upper().strip()
+        well_name = str(well)
+    
+    # Fast path: standard 96-well names and position strings
+    position = _WELL_POS.get(well_name)
+    if position is not None:
+        return position
     
     # If already a number string
     if well_name.isdigit():
         return int(well_name)
     
+    if not isinstance(well, Well) and not (well_name.isalnum() and well_name.isupper()):
+        # Lower case or padded input - normalize and retry the table
+        well_name = well_name.upper().strip()
+        position = _WELL_POS.get(well_name)
+        if position is not None:
+            return position
+        if well_name.isdigit():
+            return int(well_name)
+    
     # Parse A1, B2, etc.
     if len(well_name) < 2:
         return 1  # Default to A1
@@ -112,7 +127,7 @@ def well_to_position(well: Union[str, Well, int]) -> int:
     if not col_str.isdigit():
         return 1  # Default
     
-    row = ord(row_letter) - ord('A')  # 0-based
+    row = ord(row_letter) - 65  # 0-based (65 == ord('A'))
     col = int(col_str) - 1  # 0-based
     
     # Column-major: position = col * 8 + row + 1 (1-based for worklist)
@@ -187,66 +202,91 @@ def convert_operations_to_worklist(
     """
     wl = Worklist(name, liquid_class=liquid_class, tip_type=tip_type)
     
-    current_tips_loaded = False
+    state = {"tips_loaded": False, "liquid_class": liquid_class}
     
     for op in operations:
-        if op.operation_type == "pickup" or op.operation_type == "pick_up_tips":
-            # Get new tips
-            if not current_tips_loaded:
-                wl.break_tips()  # Get new tips
-                current_tips_loaded = True
-                if op.comment:
-                    wl.comment(f"Pick up tips: {op.comment}")
-        
-        elif op.operation_type == "aspirate":
-            if not op.resource:
-                continue
-            
-            labware_name = resource_to_labware_name(op.resource)
-            well_pos = well_to_position(op.well) if op.well else 1
-            vol = op.volume if op.volume > 0 else 100.0
-            lc = op.liquid_class if op.liquid_class else liquid_class
-            
-            wl.aspirate(
-                rack_label=labware_name,
-                well=well_pos,
-                volume=vol,
-                liquid_class=lc
-            )
-        
-        elif op.operation_type == "dispense":
-            if not op.resource:
-                continue
-            
-            labware_name = resource_to_labware_name(op.resource)
-            well_pos = well_to_position(op.well) if op.well else 1
-            vol = op.volume if op.volume > 0 else 100.0
-            lc = op.liquid_class if op.liquid_class else liquid_class
-            
-            wl.dispense(
-                rack_label=labware_name,
-                well=well_pos,
-                volume=vol,
-                liquid_class=lc
-            )
-        
-        elif op.operation_type == "drop" or op.operation_type == "drop_tips":
-            # Drop tips
-            if current_tips_loaded:
-                if op.resource:
-                    labware_name = resource_to_labware_name(op.resource)
-                    # For drop tips, we typically use waste location
-                    # The worklist format doesn't have explicit drop tips command
-                    # So we'll add a comment
-                    wl.comment(f"Drop tips to {labware_name}")
-                current_tips_loaded = False
-        
-        if op.comment and op.operation_type not in ["pickup", "pick_up_tips"]:
-            wl.comment(op.comment)
+        convert = _OPERATION_CONVERTERS.get(op.operation_type)
+        write_comment = convert(wl, op, state) if convert is not None else True
+        if write_comment and op.comment:
+            _add_comment(wl, op.comment)
     
     return wl
 
 
+# Per-operation converters for convert_operations_to_worklist. Each takes
+# (worklist, record, state) and returns whether the record's own comment
+# should still be written after it.
+
+def _add_comment(wl: Worklist, text: str) -> None:
+    """Add a comment line unless the previous worklist line is the same comment."""
+    ops = wl.operations
+    if ops and ops[-1].command == "C" and ops[-1].comment == text:
+        return
+    wl.comment(text)
+
+
+def _convert_pick_up(wl: Worklist, op: OperationRecord, state: Dict[str, Any]) -> bool:
+    # Get new tips
+    if not state["tips_loaded"]:
+        wl.break_tips()  # Get new tips
+        state["tips_loaded"] = True
+        if op.comment:
+            _add_comment(wl, f"Pick up tips: {op.comment}")
+    return False
+
+
+def _convert_pipetting(add, op: OperationRecord, state: Dict[str, Any]) -> bool:
+    """Add an aspirate or dispense (``add`` is the bound Worklist method)."""
+    if not op.resource:
+        return False
+    
+    add(
+        rack_label=resource_to_labware_name(op.resource),
+        well=well_to_position(op.well) if op.well else 1,
+        volume=op.volume if op.volume > 0 else 100.0,
+        liquid_class=op.liquid_class if op.liquid_class else state["liquid_class"]
+    )
+    return True
+
+
+def _convert_aspirate(wl: Worklist, op: OperationRecord, state: Dict[str, Any]) -> bool:
+    return _convert_pipetting(wl.aspirate, op, state)
+
+
+def _convert_dispense(wl: Worklist, op: OperationRecord, state: Dict[str, Any]) -> bool:
+    return _convert_pipetting(wl.dispense, op, state)
+
+
+def _convert_drop(wl: Worklist, op: OperationRecord, state: Dict[str, Any]) -> bool:
+    # Drop tips
+    if state["tips_loaded"]:
+        if op.resource:
+            labware_name = resource_to_labware_name(op.resource)
+            # For drop tips, we typically use waste location
+            # The worklist format doesn't have explicit drop tips command
+            # So we'll add a comment
+            _add_comment(wl, f"Drop tips to {labware_name}")
+        state["tips_loaded"] = False
+    return True
+
+
+_OPERATION_CONVERTERS = {
+    "pickup": _convert_pick_up,
+    "pick_up_tips": _convert_pick_up,
+    "aspirate": _convert_aspirate,
+    "dispense": _convert_dispense,
+    "drop": _convert_drop,
+    "drop_tips": _convert_drop,
+}
+
+
+def _resource_well(resource):
+    """Well reference for an aspirate/dispense resource: its name, or the Well itself."""
+    if not resource:
+        return None
+    return getattr(resource, 'name', resource if isinstance(resource, Well) else None)
+
+
 def convert_pylabrobot_operations(
     aspirations: Optional[List[Aspiration]] = None,
     dispenses: Optional[List[Dispense]] = None,
@@ -288,16 +328,15 @@ def convert_pylabrobot_operations(
         wl.save("my_worklist.gwl")
     """
     operations = []
+    append = operations.append
     
     # Convert pickups
     if pickups:
         for pickup in pickups:
-            resource = pickup.resource if hasattr(pickup, 'resource') else None
-            well = None
+            resource = getattr(pickup, 'resource', None)
             # Extract well name if resource is a Well object
-            if resource and hasattr(resource, 'name'):
-                well = resource.name
-            operations.append(OperationRecord(
+            well = getattr(resource, 'name', None) if resource else None
+            append(OperationRecord(
                 operation_type="pickup",
                 resource=resource,
                 well=well,
@@ -307,22 +346,13 @@ def convert_pylabrobot_operations(
     # Convert aspirations
     if aspirations:
         for asp in aspirations:
-            resource = asp.resource if hasattr(asp, 'resource') else None
-            volume = float(asp.volume) if hasattr(asp, 'volume') else 0.0
+            resource = getattr(asp, 'resource', None)
+            volume = float(getattr(asp, 'volume', 0.0))
             liquid_class = getattr(asp, 'liquid_class', liquid_class)
-            
-            # Try to get well name
-            well = None
-            if resource:
-                if hasattr(resource, 'name'):
-                    well = resource.name
-                elif isinstance(resource, Well):
-                    well = resource
-            
-            operations.append(OperationRecord(
+            append(OperationRecord(
                 operation_type="aspirate",
                 resource=resource,
-                well=well,
+                well=_resource_well(resource),
                 volume=volume,
                 liquid_class=liquid_class
             ))
@@ -330,22 +360,13 @@ def convert_pylabrobot_operations(
     # Convert dispenses
     if dispenses:
         for disp in dispenses:
-            resource = disp.resource if hasattr(disp, 'resource') else None
-            volume = float(disp.volume) if hasattr(disp, 'volume') else 0.0
+            resource = getattr(disp, 'resource', None)
+            volume = float(getattr(disp, 'volume', 0.0))
             liquid_class = getattr(disp, 'liquid_class', liquid_class)
-            
-            # Try to get well name
-            well = None
-            if resource:
-                if hasattr(resource, 'name'):
-                    well = resource.name
-                elif isinstance(resource, Well):
-                    well = resource
-            
-            operations.append(OperationRecord(
+            append(OperationRecord(
                 operation_type="dispense",
                 resource=resource,
-                well=well,
+                well=_resource_well(resource),
                 volume=volume,
                 liquid_class=liquid_class
             ))
@@ -353,10 +374,9 @@ def convert_pylabrobot_operations(
     # Convert drops
     if drops:
         for drop in drops:
-            resource = drop.resource if hasattr(drop, 'resource') else None
-            operations.append(OperationRecord(
+            append(OperationRecord(
                 operation_type="drop",
-                resource=resource,
+                resource=getattr(drop, 'resource', None),
                 comment="Drop tips"
             ))
     
@@ -11,44 +11,95 @@ This test will:
 import sys
 import os
 
-if not hasattr(sys, 'coinit_flags'):
-    sys.coinit_flags = 0
+# COM only exists on Windows; elsewhere there is nothing to initialise.
+if sys.platform == "win32":
+    if not hasattr(sys, 'coinit_flags'):
+        sys.coinit_flags = 0
 
-try:
-    import comtypes.client
-except ImportError:
-    pass
+    try:
+        import comtypes.client
+    except ImportError:
+        pass
 
 import asyncio
+import json
 import logging
 import time
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from pyfluent.backends.fluent_visionx import FluentVisionX
-from pyfluent.backends.inspector import print_configuration_summary
+from pyfluent.backends.inspector import get_configuration_summary, print_configuration_summary
+from pyfluent.constants import DEFAULT_DITI_TYPE
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 LOG = logging.getLogger("TipsAndAspirateTest")
 
+_BANNER = "=" * 60
+
+_INTRO = "\n".join((
+    _BANNER,
+    "Tips and Aspirate Test",
+    _BANNER,
+    "This test will:",
+    "  1. Connect to FluentControl in simulation mode",
+    "  2. Show available labware and liquid classes",
+    "  3. Start method 'demo' (or use existing running method)",
+    "  4. Wait for API channel",
+    "  5. Pick up tips (get_tips)",
+    "  6. Aspirate 50µL from well A1 of a 96-well plate",
+    "  7. Dispense 50µL to well A2 of the same plate",
+    _BANNER,
+    "",
+))
+
+_OUTRO = "\n".join((
+    "",
+    _BANNER,
+    "Test complete!",
+    _BANNER,
+    "If you saw movement in the 3D viewer:",
+    "  - Pipette moving to pick up tips",
+    "  - Pipette moving to well plate and aspirating from A1",
+    "  - Pipette moving to well A2 and dispensing",
+    "Then PyFluent is working correctly in simulation mode!",
+    "",
+    "You can now try more complex protocols with multiple wells, transfers, etc.",
+))
+
+# Remembers which liquid class worked for a labware/tip combination so the
+# next run tries it first instead of failing through the list again.
+_LIQUID_CLASS_CACHE = os.path.join(os.path.expanduser("~"), ".pyfluent", "liquid_class_cache.json")
+
+
+def _load_liquid_class_cache() -> dict:
+    try:
+        with open(_LIQUID_CLASS_CACHE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_liquid_class(key: str, liquid_class: str) -> None:
+    cache = _load_liquid_class_cache()
+    if cache.get(key) == liquid_class:
+        return
+    cache[key] = liquid_class
+    try:
+        os.makedirs(os.path.dirname(_LIQUID_CLASS_CACHE), exist_ok=True)
+        with open(_LIQUID_CLASS_CACHE, "w") as f:
+            json.dump(cache, f, indent=2)
+    except OSError as e:
+        LOG.debug("Could not update liquid class cache: %s", e)
+
 
 async def main():
-    LOG.info("=" * 60)
-    LOG.info("Tips and Aspirate Test")
-    LOG.info("=" * 60)
-    LOG.info("This test will:")
-    LOG.info("  1. Connect to FluentControl in simulation mode")
-    LOG.info("  2. Show available labware and liquid classes")
-    LOG.info("  3. Start method 'demo' (or use existing running method)")
-    LOG.info("  4. Wait for API channel")
-    LOG.info("  5. Pick up tips (get_tips)")
-    LOG.info("  6. Aspirate 50µL from well A1 of a 96-well plate")
-    LOG.info("  7. Dispense 50µL to well A2 of the same plate")
-    LOG.info("=" * 60)
-    LOG.info("")
+    LOG.info(_INTRO)
     
     backend = FluentVisionX(num_channels=8, simulation_mode=True, with_visualization=False)
     
+    loop = asyncio.get_running_loop()
+    
     try:
         # Connect
         LOG.info("1. Connecting to FluentControl...")
@@ -57,20 +108,24 @@ async def main():
         
         # Show available configuration
         LOG.info("2. Checking available configuration...")
-        print_configuration_summary(backend)
+        configuration = get_configuration_summary(backend)
+        print_configuration_summary(backend, configuration)
         LOG.info("")
         
         # Show 3D viewer
-        LOG.info("3. Showing 3D viewer...")
-        backend.show_3d_viewer()
-        backend.enable_animation(True)
-        backend.set_simulation_speed(1.0)
-        LOG.info("✓ 3D viewer enabled\n")
+        if backend.with_visualization:
+            LOG.info("3. Showing 3D viewer...")
+            backend.show_3d_viewer()
+            backend.enable_animation(True)
+            backend.set_simulation_speed(1.0)
+            LOG.info("✓ 3D viewer enabled\n")
+        else:
+            LOG.info("3. Visualization disabled, not opening the 3D viewer\n")
         
         # Run method (or use existing)
         LOG.info("4. Starting/running method 'demo'...")
         success = await backend.run_method("demo", wait_for_completion=False)
-        LOG.info(f"   RunMethod result: {success}\n")
+        LOG.info("   RunMethod result: %s\n", success)
         
         # Wait for channel
         LOG.info("5. Waiting for API channel...")
@@ -85,17 +140,17 @@ async def main():
         await asyncio.sleep(2)
         
         # Test get_tips
+        # The backend reports no completion event for pipetting commands, so
+        # each one is followed by a settle wait for the movement to finish.
         LOG.info("6. Picking up tips...")
         LOG.info("   (You should see the pipette move to pick up tips in the 3D viewer)")
         try:
             backend.get_tips()
             LOG.info("✓ get_tips() command executed successfully!")
-            # Wait for movement to complete in simulation
-            await asyncio.sleep(3)
+            # Let the movement settle while the aspirate is prepared below
+            settle_until = loop.time() + 3
         except Exception as e:
-            LOG.error(f"✗ get_tips() failed: {e}")
-            import traceback
-            traceback.print_exc()
+            LOG.exception("✗ get_tips() failed: %s", e)
             return
         
         # Test aspirate from well plate
@@ -115,12 +170,35 @@ async def main():
         
         # Try liquid classes: "DMSO Free Single_1", "Empty Tip", and "Ethanol Free single"
         liquid_classes_to_try = ["DMSO Free Single_1", "Empty Tip", "Ethanol Free single"]
+        
+        # Skip names FluentControl doesn't know instead of letting each one fail
+        # through a COM call. The lists are empty if they couldn't be retrieved.
+        if configuration["labware"] and source_labware not in configuration["labware"]:
+            LOG.warning("   Labware '%s' is not in the configuration summary", source_labware)
+        known_liquid_classes = set(configuration["liquid_classes"])
+        if known_liquid_classes:
+            available = [lc for lc in liquid_classes_to_try if lc in known_liquid_classes]
+            if available:
+                liquid_classes_to_try = available
+            else:
+                LOG.warning("   None of the liquid classes to try are listed; trying them anyway")
+        
+        cache_key = f"{source_labware}|{DEFAULT_DITI_TYPE}"
+        cached_liquid_class = _load_liquid_class_cache().get(cache_key)
+        if cached_liquid_class in liquid_classes_to_try:
+            LOG.info("   Trying cached liquid class '%s' first", cached_liquid_class)
+            liquid_classes_to_try.remove(cached_liquid_class)
+            liquid_classes_to_try.insert(0, cached_liquid_class)
         aspirate_success = False
         working_liquid_class = None
+        last_liquid_class = liquid_classes_to_try[-1]
+        
+        # Wait out whatever is left of the get_tips settle time
+        await asyncio.sleep(max(0, settle_until - loop.time()))
         
         for liquid_class in liquid_classes_to_try:
             try:
-                LOG.info(f"   Trying liquid class: '{liquid_class}'...")
+                LOG.info("   Trying liquid class: '%s'...", liquid_class)
                 backend.aspirate_volume(
                     volumes=[50],  # 50µL
                     labware=source_labware,
@@ -128,24 +206,24 @@ async def main():
                     well_offsets=[0],  # Well A1 (offset 0)
                     tip_indices=[0]  # Use tip 0 (first tip)
                 )
-                LOG.info(f"✓ aspirate_volume() succeeded with liquid class '{liquid_class}'!")
+                LOG.info("✓ aspirate_volume() succeeded with liquid class '%s'!", liquid_class)
                 aspirate_success = True
                 working_liquid_class = liquid_class  # Save the working liquid class
+                _save_liquid_class(cache_key, liquid_class)
                 # Wait for movement to complete in simulation
                 await asyncio.sleep(3)
                 break
             except Exception as e:
-                LOG.warning(f"✗ Liquid class '{liquid_class}' failed: {e}")
-                if liquid_class != liquid_classes_to_try[-1]:
-                    LOG.info(f"   Trying next liquid class...")
-                    await asyncio.sleep(1)  # Brief pause between attempts
+                LOG.warning("✗ Liquid class '%s' failed: %s", liquid_class, e)
+                if liquid_class != last_liquid_class:
+                    LOG.info("   Trying next liquid class...")
         
         if not aspirate_success:
             LOG.error("✗ aspirate_volume() failed with all liquid classes tried")
             LOG.error("")
             LOG.error("Tried liquid classes:")
             for lc in liquid_classes_to_try:
-                LOG.error(f"  - '{lc}'")
+                LOG.error("  - '%s'", lc)
             LOG.error("")
             LOG.error("If you get a 'Liquid subclass missing' error:")
             LOG.error("  1. Open FluentControl")
@@ -156,8 +234,6 @@ async def main():
             LOG.error("If you get a 'Select a valid labware' error:")
             LOG.error("  1. Check the labware name in FluentControl worktable")
             LOG.error("  2. Update 'source_labware' or 'dest_labware' in this script to match exactly")
-            import traceback
-            traceback.print_exc()
             return
         
         # Test dispense to another well
@@ -181,34 +257,22 @@ async def main():
                     well_offsets=[1],  # Well A2 (offset 1)
                     tip_indices=[0]  # Use tip 0 (first tip)
                 )
-                LOG.info(f"✓ dispense_volume() succeeded with liquid class '{liquid_class}'!")
+                LOG.info("✓ dispense_volume() succeeded with liquid class '%s'!", liquid_class)
                 # Wait for movement to complete in simulation
                 await asyncio.sleep(3)
             except Exception as e:
-                LOG.error(f"✗ dispense_volume() failed: {e}")
-                import traceback
-                traceback.print_exc()
+                LOG.exception("✗ dispense_volume() failed: %s", e)
         
-        LOG.info("")
-        LOG.info("=" * 60)
-        LOG.info("Test complete!")
-        LOG.info("=" * 60)
-        LOG.info("If you saw movement in the 3D viewer:")
-        LOG.info("  - Pipette moving to pick up tips")
-        LOG.info("  - Pipette moving to well plate and aspirating from A1")
-        LOG.info("  - Pipette moving to well A2 and dispensing")
-        LOG.info("Then PyFluent is working correctly in simulation mode!")
-        LOG.info("")
-        LOG.info("You can now try more complex protocols with multiple wells, transfers, etc.")
+        LOG.info(_OUTRO)
         
-        # Keep running for a bit so user can see the result
-        LOG.info("Waiting 5 seconds before closing...")
-        await asyncio.sleep(5)
+        # Keep running for a bit so user can see the result. Without
+        # visualization there is no viewer to watch, so close straight away.
+        if backend.with_visualization:
+            LOG.info("Waiting 5 seconds before closing...")
+            await asyncio.sleep(5)
         
     except Exception as e:
-        LOG.error(f"Error: {e}")
-        import traceback
-        traceback.print_exc()
+        LOG.exception("Error: %s", e)
     finally:
         if backend:
             try:
@@ -0,0 +1,88 @@
+"""Tests for worklist generation."""
+
+import csv
+import io
+
+from pyfluent import Protocol, Worklist
+from pyfluent import worklist as worklist_module
+
+
+def _csv_writer_output(wl: Worklist) -> str:
+    """Reference CSV built with csv.writer, row by row."""
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(["Command", "RackLabel", "Position", "Volume", "LiquidClass", "Comment"])
+    for op in wl.operations:
+        writer.writerow(op.to_csv_row())
+    return output.getvalue()
+
+
+def test_to_csv_matches_csv_writer():
+    wl = Worklist("CSV")
+    wl.comment("plain comment")
+    wl.transfer("Source", "A1", "Dest", "B2", 50)
+    wl.wash_tips()
+    wl.break_tips()
+    assert wl.to_csv() == _csv_writer_output(wl)
+
+
+def test_to_csv_matches_csv_writer_when_fields_need_quoting():
+    for text in ["a, b", 'say "hi"', "two\nlines", "carriage\rreturn", ""]:
+        wl = Worklist("CSV")
+        wl.aspirate("Source", "A1", 10)
+        wl.comment(text)
+        wl.dispense("Dest, plate", "A1", 10)
+        assert wl.to_csv() == _csv_writer_output(wl), text
+
+
+def test_to_csv_empty_worklist():
+    assert Worklist().to_csv() == _csv_writer_output(Worklist())
+
+
+def test_write_gwl_matches_to_gwl(monkeypatch):
+    # Small batches so the output is written in several chunks
+    monkeypatch.setattr(worklist_module, "_WRITE_BATCH_LINES", 7)
+    wl = Worklist("GWL")
+    wl.comment("start")
+    for i in range(1, 97):
+        wl.transfer("Source", f"{'ABCDEFGH'[(i - 1) % 8]}{(i - 1) // 8 + 1}", "Dest", i, 12.5)
+    wl.wash_tips()
+    wl.break_tips()
+    fh = io.StringIO()
+    wl.write_gwl(fh)
+    assert fh.getvalue() == wl.to_gwl()
+
+
+def test_write_gwl_empty_worklist():
+    wl = Worklist()
+    fh = io.StringIO()
+    wl.write_gwl(fh)
+    assert fh.getvalue() == wl.to_gwl()
+
+
+def test_extend_transfers_matches_transfer_loop():
+    source_wells = ["A1", "b1", "H12", 5, "17"]
+    dest_wells = ["A2", "B2", "C2", "D2", "E2"]
+    for new_tip_each in (False, True):
+        for liquid_class in (None, "Custom"):
+            bulk = Worklist(tip_type="DiTi 200")
+            bulk.extend_transfers("Source", source_wells, "Dest", dest_wells, 25,
+                                  liquid_class, new_tip_each=new_tip_each)
+            loop = Worklist(tip_type="DiTi 200")
+            for src, dst in zip(source_wells, dest_wells):
+                loop.transfer("Source", src, "Dest", dst, 25, liquid_class, new_tip=new_tip_each)
+            assert bulk.operations == loop.operations
+
+
+def test_bulk_transfer_matches_transfer_loop():
+    source_wells = ["A1", "B1", "H12"]
+    dest_wells = ["A2", "B2", "C2"]
+    for volumes in (50, [10, 20.5, 30]):
+        per_well = volumes if isinstance(volumes, list) else [volumes] * len(source_wells)
+        bulk = Protocol("Bulk")
+        bulk.bulk_transfer("Source", source_wells, "Dest", dest_wells, volumes, "Custom")
+        loop = Protocol("Loop")
+        for src, dst, vol in zip(source_wells, dest_wells, per_well):
+            loop.transfer("Source", src, "Dest", dst, vol, "Custom")
+        assert [c.to_dict() for c in bulk.commands] == [c.to_dict() for c in loop.commands]
+        assert bulk.transfers == loop.transfers